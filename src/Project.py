@@ -1,23 +1,62 @@
 import os
+import sys
 import csv
 import datetime as dt
-import pandas as pd
+import numpy as np
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
-from collections import defaultdict, Counter
+from typing import List, Dict, Optional, Tuple, Union
+from collections import defaultdict, Counter, OrderedDict
 import hashlib
+import hmac
 import json
+import re
+from array import array
+from pathlib import Path
+from bisect import insort
+from heapq import nlargest
+from operator import attrgetter, itemgetter
+from itertools import chain, count
+import queue
+import threading
+
+from analyzer_kernels import month_agg as _month_agg, category_sums as _category_sums, daily_sums as _daily_sums
+
+try:
+    import orjson
+    _json_dumps, _json_loads = orjson.dumps, orjson.loads
+except ImportError:  # orjson is optional; compact stdlib json is used instead
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    _json_loads = json.loads
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+
+# Read/write buffer for the CSV data files; amortises syscalls on large files
+_IO_BUFFER_SIZE = 1 << 20
+
+
+def _load_matplotlib():
+    """Import matplotlib on first chart open so app startup doesn't pay for it"""
+    import matplotlib
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    # Let Agg drop vertices that don't change the rendered pixels
+    matplotlib.rcParams.update({
+        'path.simplify': True,
+        'path.simplify_threshold': 1.0,
+        'agg.path.chunksize': 10000,
+    })
+    return Figure, FigureCanvasAgg
 
 # -----------------------------
 # Authentication System
 # -----------------------------
 
+_SHA = hashlib.sha256
+_PBKDF2_ITERATIONS = 100_000
+_USER_FIELDS = ["username", "password_hash", "full_name", "created_at", "salt"]
+
 class AuthManager:
     """Handles user authentication and password management"""
     
@@ -25,6 +64,8 @@ class AuthManager:
         self.users_file = "users.csv"
         self.session_file = "session.json"
         self.current_user = None
+        self._users_cache: Optional[Dict] = None
+        self._users_mtime = 0
         self._init_users_file()
         
     def _init_users_file(self):
@@ -32,14 +73,39 @@ class AuthManager:
         if not os.path.exists(self.users_file):
             with open(self.users_file, "w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
-                writer.writerow(["username", "password_hash", "full_name", "created_at"])
+                writer.writerow(_USER_FIELDS)
                 # Create default admin user (password: admin123)
-                admin_hash = self._hash_password("admin123")
-                writer.writerow(["admin", admin_hash, "Administrator", dt.datetime.now().isoformat()])
+                salt = os.urandom(16)
+                admin_hash = self._hash_password("admin123", salt)
+                writer.writerow(["admin", admin_hash, "Administrator", dt.datetime.now().isoformat(), salt.hex()])
+        else:
+            self._upgrade_users_file()
+    
+    def _upgrade_users_file(self):
+        """Add the salt column to users files created before salted hashing"""
+        with open(self.users_file, "r", newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        if not rows or "salt" in rows[0]:
+            return
+        # Legacy rows keep an empty salt and are verified with plain SHA-256
+        self._write_users([rows[0] + ["salt"]] + [row + [""] for row in rows[1:]])
+    
+    def _write_users(self, rows: List[List[str]]):
+        """Replace the users file with rows via a temp file, so a failed write never truncates it"""
+        tmp_path = self.users_file + ".tmp"
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(rows)
+        os.replace(tmp_path, self.users_file)
+    
+    def _password_digest(self, password: str, salt: bytes) -> bytes:
+        """Derive the raw password digest; unsalted rows use legacy SHA-256"""
+        if not salt:
+            return _SHA(password.encode("utf-8")).digest()
+        return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, _PBKDF2_ITERATIONS)
     
-    def _hash_password(self, password: str) -> str:
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def _hash_password(self, password: str, salt: bytes) -> str:
+        """Hash password using PBKDF2-HMAC-SHA256"""
+        return self._password_digest(password, salt).hex()
     
     def register_user(self, username: str, password: str, full_name: str) -> Tuple[bool, str]:
         """Register a new user"""
@@ -59,10 +125,12 @@ class AuthManager:
             return False, "Username already exists"
         
         # Add new user
-        password_hash = self._hash_password(password)
+        salt = os.urandom(16)
+        password_hash = self._hash_password(password, salt)
         with open(self.users_file, "a", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
-            writer.writerow([username, password_hash, full_name, dt.datetime.now().isoformat()])
+            writer.writerow([username, password_hash, full_name, dt.datetime.now().isoformat(), salt.hex()])
+        self._users_mtime = 0
         
         return True, "Registration successful"
     
@@ -75,9 +143,12 @@ class AuthManager:
         if username not in users:
             return False, "Invalid username or password"
         
-        password_hash = self._hash_password(password)
-        if users[username]["password_hash"] != password_hash:
+        digest = self._password_digest(password, users[username]["salt"])
+        if not hmac.compare_digest(users[username]["password_digest"], digest):
             return False, "Invalid username or password"
+        if not users[username]["salt"]:
+            # The password is known to be right here, so move the legacy row onto PBKDF2
+            self._rehash_user(username, password)
         
         self.current_user = {
             "username": username,
@@ -86,34 +157,64 @@ class AuthManager:
         self._save_session()
         return True, "Login successful"
     
+    def _rehash_user(self, username: str, password: str):
+        """Store a fresh salt and PBKDF2 hash for one user"""
+        with open(self.users_file, "r", newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        header = rows[0]
+        name_idx, hash_idx, salt_idx = (header.index(col) for col in ("username", "password_hash", "salt"))
+        salt = os.urandom(16)
+        for row in rows[1:]:
+            if row[name_idx] == username:
+                row[hash_idx] = self._hash_password(password, salt)
+                row[salt_idx] = salt.hex()
+        self._write_users(rows)
+        self._users_mtime = 0
+    
     def _load_users(self) -> Dict:
-        """Load all users from file"""
+        """Load all users from file, reusing the cached copy while it is unchanged"""
+        try:
+            mtime = os.stat(self.users_file).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        if self._users_cache is not None and mtime == self._users_mtime:
+            return self._users_cache
+        
         users = {}
         try:
-            with open(self.users_file, "r", newline="", encoding="utf-8") as f:
+            with open(self.users_file, "r", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
                 reader = csv.DictReader(f)
                 for row in reader:
+                    try:
+                        password_digest = bytes.fromhex(row["password_hash"])
+                        salt = bytes.fromhex(row.get("salt") or "")
+                    except ValueError:
+                        password_digest, salt = b"", b""
                     users[row["username"]] = {
                         "password_hash": row["password_hash"],
+                        "password_digest": password_digest,
+                        "salt": salt,
                         "full_name": row["full_name"],
                         "created_at": row["created_at"]
                     }
         except FileNotFoundError:
             pass
+        self._users_cache = users
+        self._users_mtime = mtime
         return users
     
     def _save_session(self):
         """Save current session"""
         if self.current_user:
-            with open(self.session_file, "w") as f:
-                json.dump(self.current_user, f)
+            with open(self.session_file, "wb") as f:
+                f.write(_json_dumps(self.current_user))
     
     def load_session(self) -> bool:
         """Load saved session if exists"""
         try:
             if os.path.exists(self.session_file):
-                with open(self.session_file, "r") as f:
-                    self.current_user = json.load(f)
+                with open(self.session_file, "rb") as f:
+                    self.current_user = _json_loads(f.read())
                 return True
         except:
             pass
@@ -130,6 +231,35 @@ class AuthManager:
         return self.current_user
 
 
+def _ensure_styles(root: tk.Misc) -> None:
+    """Apply the custom ttk styles once per Tk interpreter"""
+    if getattr(root, "_styles_initialized", False):
+        return
+    style = ttk.Style(root)
+    style.theme_use('default')
+    style.configure('Custom.TNotebook', background="#1a1a2e", borderwidth=0)
+    style.configure('Custom.TNotebook.Tab', 
+                   background="#16213e", 
+                   foreground="#94a3b8",
+                   padding=[20, 10],
+                   font=("Segoe UI", 11, "bold"))
+    style.map('Custom.TNotebook.Tab',
+             background=[('selected', '#0f3460')],
+             foreground=[('selected', '#00d4ff')])
+    root._styles_initialized = True
+
+def _make_entry(parent, label: str, pady: Tuple[int, int], label_size: int = 11, label_pady: int = 8,
+                font_size: int = 12, bd: int = 10, show: Optional[str] = None) -> tk.Entry:
+    """Build a labelled, framed entry in the login window's dark style"""
+    tk.Label(parent, text=label, 
+            font=("Segoe UI", label_size, "bold"), fg="#cbd5e1", bg="#16213e").pack(anchor="w", pady=(0, label_pady))
+    frame = tk.Frame(parent, bg="#0f3460", highlightbackground="#1e40af", highlightthickness=2)
+    frame.pack(fill="x", pady=pady)
+    entry = tk.Entry(frame, font=("Segoe UI", font_size), bg="#0f3460", fg="white", 
+                     show=show or "", relief="flat", insertbackground="white", bd=bd)
+    entry.pack(fill="x")
+    return entry
+
 class LoginWindow(tk.Tk):
     """Login/Registration Window"""
     
@@ -179,17 +309,7 @@ class LoginWindow(tk.Tk):
         main_frame.pack(fill="both", expand=True, padx=50, pady=30)
         
         # Custom styled notebook
-        style = ttk.Style()
-        style.theme_use('default')
-        style.configure('Custom.TNotebook', background="#1a1a2e", borderwidth=0)
-        style.configure('Custom.TNotebook.Tab', 
-                       background="#16213e", 
-                       foreground="#94a3b8",
-                       padding=[20, 10],
-                       font=("Segoe UI", 11, "bold"))
-        style.map('Custom.TNotebook.Tab',
-                 background=[('selected', '#0f3460')],
-                 foreground=[('selected', '#00d4ff')])
+        _ensure_styles(self)
         
         self.notebook = ttk.Notebook(main_frame, style='Custom.TNotebook')
         self.notebook.pack(fill="both", expand=True)
@@ -224,24 +344,10 @@ class LoginWindow(tk.Tk):
                 font=("Segoe UI", 20, "bold"), fg="#00d4ff", bg="#16213e").pack(pady=(0, 30))
         
         # Username field with modern styling
-        tk.Label(container, text="👤 Username", 
-                font=("Segoe UI", 11, "bold"), fg="#cbd5e1", bg="#16213e").pack(anchor="w", pady=(0, 8))
-        
-        username_frame = tk.Frame(container, bg="#0f3460", highlightbackground="#1e40af", highlightthickness=2)
-        username_frame.pack(fill="x", pady=(0, 20))
-        self.login_username = tk.Entry(username_frame, font=("Segoe UI", 12), bg="#0f3460", 
-                                      fg="white", relief="flat", insertbackground="white", bd=10)
-        self.login_username.pack(fill="x")
+        self.login_username = _make_entry(container, "👤 Username", (0, 20))
         
         # Password field
-        tk.Label(container, text="🔒 Password", 
-                font=("Segoe UI", 11, "bold"), fg="#cbd5e1", bg="#16213e").pack(anchor="w", pady=(0, 8))
-        
-        password_frame = tk.Frame(container, bg="#0f3460", highlightbackground="#1e40af", highlightthickness=2)
-        password_frame.pack(fill="x", pady=(0, 30))
-        self.login_password = tk.Entry(password_frame, font=("Segoe UI", 12), bg="#0f3460", 
-                                      fg="white", show="●", relief="flat", insertbackground="white", bd=10)
-        self.login_password.pack(fill="x")
+        self.login_password = _make_entry(container, "🔒 Password", (0, 30), show="●")
         
         # Login button with hover effect
         login_btn = tk.Button(container, text="🚀 Login Now", font=("Segoe UI", 13, "bold"),
@@ -267,41 +373,20 @@ class LoginWindow(tk.Tk):
         tk.Label(container, text="Create Account", 
                 font=("Segoe UI", 20, "bold"), fg="#00d4ff", bg="#16213e").pack(pady=(0, 15))
         
+        # Compact field sizing so all four fields fit the tab
+        compact = dict(label_size=10, label_pady=5, font_size=11, bd=8)
+        
         # Username
-        tk.Label(container, text="👤 Username", 
-                font=("Segoe UI", 10, "bold"), fg="#cbd5e1", bg="#16213e").pack(anchor="w", pady=(0, 5))
-        username_frame = tk.Frame(container, bg="#0f3460", highlightbackground="#1e40af", highlightthickness=2)
-        username_frame.pack(fill="x", pady=(0, 10))
-        self.reg_username = tk.Entry(username_frame, font=("Segoe UI", 11), bg="#0f3460", 
-                                    fg="white", relief="flat", insertbackground="white", bd=8)
-        self.reg_username.pack(fill="x")
+        self.reg_username = _make_entry(container, "👤 Username", (0, 10), **compact)
         
         # Full Name
-        tk.Label(container, text="👨 Full Name", 
-                font=("Segoe UI", 10, "bold"), fg="#cbd5e1", bg="#16213e").pack(anchor="w", pady=(0, 5))
-        fullname_frame = tk.Frame(container, bg="#0f3460", highlightbackground="#1e40af", highlightthickness=2)
-        fullname_frame.pack(fill="x", pady=(0, 10))
-        self.reg_fullname = tk.Entry(fullname_frame, font=("Segoe UI", 11), bg="#0f3460", 
-                                    fg="white", relief="flat", insertbackground="white", bd=8)
-        self.reg_fullname.pack(fill="x")
+        self.reg_fullname = _make_entry(container, "👨 Full Name", (0, 10), **compact)
         
         # Password
-        tk.Label(container, text="🔒 Password", 
-                font=("Segoe UI", 10, "bold"), fg="#cbd5e1", bg="#16213e").pack(anchor="w", pady=(0, 5))
-        password_frame = tk.Frame(container, bg="#0f3460", highlightbackground="#1e40af", highlightthickness=2)
-        password_frame.pack(fill="x", pady=(0, 10))
-        self.reg_password = tk.Entry(password_frame, font=("Segoe UI", 11), bg="#0f3460", 
-                                    fg="white", show="●", relief="flat", insertbackground="white", bd=8)
-        self.reg_password.pack(fill="x")
+        self.reg_password = _make_entry(container, "🔒 Password", (0, 10), show="●", **compact)
         
         # Confirm Password
-        tk.Label(container, text="🔒 Confirm Password", 
-                font=("Segoe UI", 10, "bold"), fg="#cbd5e1", bg="#16213e").pack(anchor="w", pady=(0, 5))
-        confirm_frame = tk.Frame(container, bg="#0f3460", highlightbackground="#1e40af", highlightthickness=2)
-        confirm_frame.pack(fill="x", pady=(0, 15))
-        self.reg_confirm = tk.Entry(confirm_frame, font=("Segoe UI", 11), bg="#0f3460", 
-                                   fg="white", show="●", relief="flat", insertbackground="white", bd=8)
-        self.reg_confirm.pack(fill="x")
+        self.reg_confirm = _make_entry(container, "🔒 Confirm Password", (0, 15), show="●", **compact)
         
         # Register button
         register_btn = tk.Button(container, text="✨ Create Account", font=("Segoe UI", 13, "bold"),
@@ -365,31 +450,118 @@ class LoginWindow(tk.Tk):
 # Domain Models
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Expense:
     id: int
     date: dt.date
     category: str
     description: str
     amount: float
+    # Table row built on first display; an update replaces the Expense, so it never goes stale
+    _display: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    def display_row(self) -> tuple:
+        if self._display is None:
+            self._display = (self.id, self.date.isoformat(), self.category, self.description, f"{self.amount:.2f}")
+        return self._display
 
     def to_row(self) -> List[str]:
         return [str(self.id), self.date.isoformat(), self.category, self.description, f"{self.amount:.2f}"]
 
     @staticmethod
     def from_row(row: List[str]) -> "Expense":
-        return Expense(
-            id=int(row[0]),
-            date=dt.date.fromisoformat(row[1]),
-            category=row[2],
-            description=row[3],
-            amount=float(row[4]),
+        id_, date, category, description, amount = row
+        # A file repeats a handful of categories; interning shares one string per name
+        return Expense(int(id_), dt.date.fromisoformat(date), sys.intern(category), description, float(amount))
+
+# C-level field getters for the column builds
+_get_amount = attrgetter("amount")
+_get_date = attrgetter("date")
+_get_category = attrgetter("category")
+
+def _extend_buffer(buffer: array, values: List) -> array:
+    try:
+        buffer.extend(values)
+    except BufferError:
+        # A NumPy view of the buffer is still alive elsewhere; grow a copy instead
+        buffer = array(buffer.typecode, buffer)
+        buffer.extend(values)
+    return buffer
+
+class ExpenseColumns:
+    """Struct-of-arrays view over expenses used for vectorised aggregation"""
+
+    # (attribute, array.array typecode, NumPy dtype) of each column
+    COLUMNS = (("amounts", "d", np.float64), ("date_ords", "i", np.int32),
+               ("month_keys", "i", np.int32), ("cat_ids", "q", np.int64))
+
+    def __init__(self, amounts: np.ndarray, date_ords: np.ndarray, month_keys: np.ndarray,
+                 cat_ids: np.ndarray, cat_names: List[str], cat_index: Dict[str, int]):
+        self.amounts = amounts
+        self.date_ords = date_ords
+        self.month_keys = month_keys
+        self.cat_ids = cat_ids
+        self.cat_names = cat_names
+        self.cat_index = cat_index
+        # Growable typed buffers backing the arrays once extend() is used
+        self._buffers: Optional[Tuple[array, ...]] = None
+
+    @staticmethod
+    def month_key(year: int, month: int) -> int:
+        return year * 12 + month - 1
+
+    @classmethod
+    def from_expenses(cls, expenses: List[Expense]) -> "ExpenseColumns":
+        columns = cls(*(np.empty(0, dtype=dtype) for _, _, dtype in cls.COLUMNS), [], {})
+        columns.extend(expenses)
+        return columns
+
+    def __len__(self) -> int:
+        return self.amounts.size
+
+    def _cat_id(self, category: str) -> int:
+        cat_id = self.cat_index.get(category)
+        if cat_id is None:
+            cat_id = self.cat_index[category] = len(self.cat_names)
+            self.cat_names.append(category)
+        return cat_id
+
+    def extend(self, expenses: List[Expense]) -> None:
+        """Append rows in amortised O(1) each; the arrays are zero-copy views of the buffers"""
+        if not expenses:
+            return
+        if self._buffers is None:
+            self._buffers = tuple(array(code, getattr(self, name).tobytes()) for name, code, _ in self.COLUMNS)
+        # Drop our own views so the buffers are free to resize
+        for name, _, _ in self.COLUMNS:
+            setattr(self, name, None)
+        dates = list(map(_get_date, expenses))
+        values = (
+            list(map(_get_amount, expenses)),
+            list(map(dt.date.toordinal, dates)),
+            [d.year * 12 + d.month - 1 for d in dates],
+            list(map(self._cat_id, map(_get_category, expenses))),
         )
+        self._buffers = tuple(_extend_buffer(buffer, column) for buffer, column in zip(self._buffers, values))
+        for (name, _, dtype), buffer in zip(self.COLUMNS, self._buffers):
+            setattr(self, name, np.frombuffer(buffer, dtype=dtype))
+
+    def select_month(self, year: int, month: int) -> "ExpenseColumns":
+        """Return the rows of a single month; category codes stay shared"""
+        mask = self.month_keys == self.month_key(year, month)
+        return ExpenseColumns(self.amounts[mask], self.date_ords[mask], self.month_keys[mask],
+                              self.cat_ids[mask], self.cat_names, self.cat_index)
+
+    def category_totals(self) -> np.ndarray:
+        return _category_sums(self.cat_ids, self.amounts, len(self.cat_names))
 
 # -----------------------------
 # Multi-Section Storage Layer
 # -----------------------------
 
+# Same bytes csv.writer would emit for the header row
+_EXPENSE_HEADER_LINE = "id,date,category,description,amount\r\n"
+
 class MultiFileStorage:
     SECTIONS = {
         "personal": {"filename": "personal_expenses", "emoji": "👤", "color": "#e74c3c", "label": "Personal"},
@@ -403,12 +575,17 @@ class MultiFileStorage:
         self._init_all_files()
 
     def _init_all_files(self):
+        # One directory scan instead of a stat per section file
+        existing = {entry.name for entry in os.scandir(".")}
         for section_key, section_info in self.SECTIONS.items():
             filepath = self._get_user_filepath(section_info["filename"])
-            if not os.path.exists(filepath):
-                with open(filepath, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.writer(f)
-                    writer.writerow(["id", "date", "category", "description", "amount"])
+            if filepath not in existing:
+                # The scan is case-sensitive but the filesystem may not be; "x" never truncates a file
+                try:
+                    with open(filepath, "x", newline="", encoding="utf-8") as f:
+                        f.write(_EXPENSE_HEADER_LINE)
+                except FileExistsError:
+                    pass
     
     def _get_user_filepath(self, base_filename: str) -> str:
         """Generate user-specific file path"""
@@ -431,20 +608,20 @@ class FileStorage:
 
     def _ensure_file(self):
         if not os.path.exists(self.filepath):
-            with open(self.filepath, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(self.headers)
+            Path(self.filepath).write_text(_EXPENSE_HEADER_LINE, encoding="utf-8", newline="")
 
     def load_all(self) -> List[Expense]:
         expenses = []
         try:
-            with open(self.filepath, "r", newline="", encoding="utf-8") as f:
+            with open(self.filepath, "r", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
                 reader = csv.reader(f)
                 next(reader, None)  # Skip header
+                from_row = Expense.from_row
+                append = expenses.append
                 for row in reader:
                     if len(row) == 5:
                         try:
-                            expenses.append(Expense.from_row(row))
+                            append(from_row(row))
                         except Exception:
                             continue
         except FileNotFoundError:
@@ -452,11 +629,21 @@ class FileStorage:
         return expenses
 
     def save_all(self, expenses: List[Expense]) -> None:
-        with open(self.filepath, "w", newline="", encoding="utf-8") as f:
+        # Write a sibling temp file and swap it in, so a crash never truncates the data
+        tmp_path = self.filepath + ".tmp"
+        with open(tmp_path, "w", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow(self.headers)
-            for exp in expenses:
-                writer.writerow(exp.to_row())
+            writer.writerows(exp.to_row() for exp in expenses)
+        os.replace(tmp_path, self.filepath)
+
+    def append_one(self, exp: Expense) -> None:
+        with open(self.filepath, "a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(exp.to_row())
+
+    def append_many(self, expenses: List[Expense]) -> None:
+        with open(self.filepath, "a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(exp.to_row() for exp in expenses)
 
 # BulkImportManager functionality moved to SectionManager static methods
 
@@ -464,33 +651,126 @@ class FileStorage:
 # Business Logic
 # -----------------------------
 
+# Data versions are unique across managers, so a fresh manager never reuses an old one's
+_data_versions = count(1)
+
 class SectionManager:
     def __init__(self, storage: MultiFileStorage, section: str, username: str = None):
         self.storage = storage.get_storage(section)
         self.section_key = section
         self.section_info = storage.get_section_info(section)
         self.username = username
-        self.expenses: List[Expense] = self.storage.load_all()
-        self.next_id = self._compute_next_id()
-        self.categories: set = set(exp.category for exp in self.expenses) or {
+        # Expenses, categories and next_id are loaded from disk on first access
+        self._expenses: Optional[List[Expense]] = None
+        self._next_id = 1
+        self._categories: set = set()
+        self._month_index: Dict[Tuple[int, int], List[Expense]] = defaultdict(list)
+        self._columns: Optional[ExpenseColumns] = None
+        # Per-month analysis results keyed by (kind, year, month); dropped on every change
+        self._month_cache: Dict[Tuple[str, int, int], object] = {}
+        # Replaced on every change so callers can key their own caches on it
+        self.version = next(_data_versions)
+
+    def _load(self) -> None:
+        self._expenses = self.storage.load_all()
+        self._month_index = defaultdict(list)
+        categories = set()
+        max_id = 0
+        # One pass builds the month index, category set and next id
+        for exp in self._expenses:
+            self._month_index[(exp.date.year, exp.date.month)].append(exp)
+            categories.add(exp.category)
+            if exp.id > max_id:
+                max_id = exp.id
+        # IDs only ever grow from here: adds bump it, deletes leave it alone
+        self._next_id = max_id + 1
+        self._categories = categories or {
             "Food", "Transport", "Rent", "Utilities", "Entertainment", "Misc"
         }
 
-    def _compute_next_id(self) -> int:
-        return (max((e.id for e in self.expenses), default=0) + 1)
+    @property
+    def expenses(self) -> List[Expense]:
+        if self._expenses is None:
+            self._load()
+        return self._expenses
+
+    @expenses.setter
+    def expenses(self, value: List[Expense]) -> None:
+        if self._expenses is None:
+            self._load()
+        self._expenses = value
+
+    @property
+    def next_id(self) -> int:
+        if self._expenses is None:
+            self._load()
+        return self._next_id
+
+    @next_id.setter
+    def next_id(self, value: int) -> None:
+        if self._expenses is None:
+            self._load()
+        self._next_id = value
+
+    @property
+    def categories(self) -> set:
+        if self._expenses is None:
+            self._load()
+        return self._categories
+
+    def _ensure_columns(self) -> ExpenseColumns:
+        if self._columns is None:
+            self._columns = ExpenseColumns.from_expenses(self.expenses)
+        return self._columns
+
+    def _cached(self, kind: str, year: int, month: int, compute):
+        key = (kind, year, month)
+        result = self._month_cache.get(key)
+        if result is None:
+            result = self._month_cache[key] = compute()
+        return result
+
+    def _invalidate(self) -> None:
+        self._month_cache.clear()
+        self.version = next(_data_versions)
+
+    def month_columns(self, year: int, month: int) -> ExpenseColumns:
+        return self._cached("columns", year, month,
+                            lambda: self._ensure_columns().select_month(year, month))
+
+    def monthly_summary(self, year: int, month: int) -> Dict:
+        return self._cached("summary", year, month,
+                            lambda: Analyzer.month_summary(self._ensure_columns(), year, month))
+
+    def category_stats(self, year: int, month: int) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        return self._cached("categories", year, month,
+                            lambda: Analyzer.category_stats(self.month_columns(year, month)))
+
+    def full_summary(self, year: int, month: int) -> Tuple[float, float, int, Dict[str, float]]:
+        return self._cached("full", year, month,
+                            lambda: Analyzer.full_summary(self._ensure_columns(), year, month))
+
+    def daily_trend(self, year: int, month: int) -> List[Tuple[dt.date, float]]:
+        return self._cached("trend", year, month,
+                            lambda: Analyzer.daily_trend(self.month_columns(year, month)))
 
     def add_expense(self, date: dt.date, category: str, description: str, amount: float) -> Expense:
         exp = Expense(id=self.next_id, date=date, category=category, description=description, amount=amount)
         self.expenses.append(exp)
+        self._month_index[(date.year, date.month)].append(exp)
         self.categories.add(category)
         self.next_id += 1
-        self.storage.save_all(self.expenses)
+        if self._columns is not None:
+            self._columns.extend([exp])
+        self._invalidate()
+        self.storage.append_one(exp)
         return exp
 
     def bulk_add_expenses(self, expenses_data: List[Dict]) -> Tuple[int, int]:
         """Add multiple expenses and return (success_count, skipped_count)"""
-        success_count = 0
         skipped_count = 0
+        added = []
+        next_id = self.next_id
         
         for expense_data in expenses_data:
             try:
@@ -499,36 +779,65 @@ class SectionManager:
                 description = expense_data['description'].strip()
                 amount = float(expense_data['amount'])
                 
-                exp = Expense(id=self.next_id, date=date, category=category, 
-                            description=description, amount=amount)
-                self.expenses.append(exp)
-                self.categories.add(category)
-                self.next_id += 1
-                success_count += 1
+                added.append(Expense(id=next_id, date=date, category=category, 
+                                     description=description, amount=amount))
+                next_id += 1
             except Exception:
                 skipped_count += 1
                 continue
         
-        if success_count > 0:
-            self.storage.save_all(self.expenses)
-        
+        if added:
+            # Write first so a failed append leaves the in-memory state untouched
+            self.storage.append_many(added)
+            self.expenses.extend(added)
+            for exp in added:
+                self._month_index[(exp.date.year, exp.date.month)].append(exp)
+            self.categories.update(exp.category for exp in added)
+            self.next_id = next_id
+            if self._columns is not None:
+                self._columns.extend(added)
+            self._invalidate()
+        
+        success_count = len(added)
         return success_count, skipped_count
     
     @staticmethod
     def parse_csv_file(filepath: str) -> List[Dict]:
         """Parse CSV file and return list of expense dictionaries"""
         try:
-            df = pd.read_csv(filepath)
             expenses = []
-            
-            for idx, row in df.iterrows():
-                expense = {
-                    'date': row.get('date', ''),
-                    'category': row.get('category', row.get('Category', '')),
-                    'description': row.get('item', row.get('Item', row.get('description', ''))),
-                    'amount': float(row.get('cost', row.get('Cost', row.get('amount', 0))))
-                }
-                expenses.append(expense)
+            with open(filepath, "r", newline="", encoding="utf-8-sig", buffering=_IO_BUFFER_SIZE) as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                width = len(header)
+                # Map each header case-insensitively once, keeping the first column seen
+                headers = {}
+                for index, name in enumerate(header):
+                    headers.setdefault(name.strip().lower(), index)
+                
+                def resolve(*aliases):
+                    # Pick the first header alias present in the file; missing columns
+                    # read the blank cell appended to every row
+                    return next((headers[alias] for alias in aliases if alias in headers), -1)
+                
+                # Pull the four fields out of each row in C rather than building a dict per row
+                pick = itemgetter(resolve('date'), resolve('category'),
+                                  resolve('item', 'description'), resolve('cost', 'amount'))
+                
+                append = expenses.append
+                for row in reader:
+                    if not row:
+                        continue  # blank line
+                    if len(row) < width:
+                        row.extend([''] * (width - len(row)))
+                    row.append('')
+                    date, category, description, amount = pick(row)
+                    append({
+                        'date': date,
+                        'category': category,
+                        'description': description,
+                        'amount': float(amount or 0)
+                    })
             return expenses
         except Exception as e:
             raise ValueError(f"CSV parsing error: {str(e)}")
@@ -570,23 +879,47 @@ class SectionManager:
     def update_expense(self, expense_id: int, date: dt.date, category: str, description: str, amount: float) -> bool:
         for i, e in enumerate(self.expenses):
             if e.id == expense_id:
-                self.expenses[i] = Expense(id=expense_id, date=date, category=category, description=description, amount=amount)
+                updated = Expense(id=expense_id, date=date, category=category, description=description, amount=amount)
+                self.expenses[i] = updated
+                self._unindex(e)
+                # Buckets stay in id order, which is also the file order
+                insort(self._month_index[(date.year, date.month)], updated, key=attrgetter("id"))
                 self.categories.add(category)
+                self._columns = None
+                self._invalidate()
                 self.storage.save_all(self.expenses)
                 return True
         return False
 
     def delete_expense(self, expense_id: int) -> bool:
         before = len(self.expenses)
+        removed = [e for e in self.expenses if e.id == expense_id]
         self.expenses = [e for e in self.expenses if e.id != expense_id]
         after = len(self.expenses)
         if after < before:
+            for e in removed:
+                self._unindex(e)
+            self._columns = None
+            self._invalidate()
             self.storage.save_all(self.expenses)
             return True
         return False
 
+    def _unindex(self, exp: Expense) -> None:
+        bucket = self._month_index[(exp.date.year, exp.date.month)]
+        bucket.remove(exp)
+        if not bucket:
+            del self._month_index[(exp.date.year, exp.date.month)]
+
     def filter_by_month(self, year: int, month: int) -> List[Expense]:
-        return [e for e in self.expenses if e.date.year == year and e.date.month == month]
+        if self._expenses is None:
+            self._load()
+        return list(self._month_index.get((year, month), ()))
+
+    def count_by_month(self, year: int, month: int) -> int:
+        if self._expenses is None:
+            self._load()
+        return len(self._month_index.get((year, month), ()))
 
     def get_all(self) -> List[Expense]:
         return list(self.expenses)
@@ -597,18 +930,29 @@ class SectionManager:
     def get_categories(self) -> List[str]:
         return sorted(self.categories)
 
+ExpenseData = Union[List[Expense], ExpenseColumns]
+
 class Analyzer:
     @staticmethod
-    def monthly_summary(expenses: List[Expense]) -> Dict:
-        total = sum(e.amount for e in expenses)
-        by_category = defaultdict(float)
-        for e in expenses:
-            by_category[e.category] += e.amount
-        days = len(set(e.date for e in expenses)) or 1
-        avg_per_day = total / days
+    def _columns(expenses: ExpenseData) -> ExpenseColumns:
+        if isinstance(expenses, ExpenseColumns):
+            return expenses
+        return ExpenseColumns.from_expenses(expenses)
+
+    @staticmethod
+    def _distinct_days(date_ords: np.ndarray) -> int:
+        """Count distinct days with a presence table instead of sorting (np.unique)"""
+        if not date_ords.size:
+            return 0
+        return int(np.count_nonzero(np.bincount(date_ords - date_ords.min())))
+
+    @staticmethod
+    def _summary(total: float, days: int, cat_totals: np.ndarray, cat_names: List[str]) -> Dict:
+        avg_per_day = total / (days or 1)
         top_category, top_amount = (None, 0.0)
-        if by_category:
-            top_category, top_amount = max(by_category.items(), key=lambda x: x[1])
+        if days:
+            top_idx = int(cat_totals.argmax())
+            top_category, top_amount = cat_names[top_idx], float(cat_totals[top_idx])
         return {
             "total": total,
             "avg_per_day": avg_per_day,
@@ -617,18 +961,63 @@ class Analyzer:
         }
 
     @staticmethod
-    def category_breakdown(expenses: List[Expense]) -> Dict[str, float]:
-        breakdown = defaultdict(float)
-        for e in expenses:
-            breakdown[e.category] += e.amount
-        return dict(breakdown)
+    def monthly_summary(expenses: ExpenseData) -> Dict:
+        columns = Analyzer._columns(expenses)
+        total = float(columns.amounts.sum())
+        days = Analyzer._distinct_days(columns.date_ords)
+        return Analyzer._summary(total, days, columns.category_totals(), columns.cat_names)
 
     @staticmethod
-    def daily_trend(expenses: List[Expense]) -> List[Tuple[dt.date, float]]:
-        by_day = defaultdict(float)
-        for e in expenses:
-            by_day[e.date] += e.amount
-        return sorted(by_day.items(), key=lambda x: x[0])
+    def month_summary(columns: ExpenseColumns, year: int, month: int) -> Dict:
+        """Summarise one month straight from a section's full columns"""
+        if not dt.MINYEAR <= year <= dt.MAXYEAR:
+            # No expense date can fall there, and dt.date() would raise
+            return Analyzer._summary(0.0, 0, np.zeros(len(columns.cat_names)), columns.cat_names)
+        total, days, cat_totals = _month_agg(
+            columns.month_keys, columns.date_ords, columns.amounts, columns.cat_ids,
+            ExpenseColumns.month_key(year, month), dt.date(year, month, 1).toordinal(),
+            len(columns.cat_names))
+        return Analyzer._summary(float(total), int(days), cat_totals, columns.cat_names)
+
+    @staticmethod
+    def full_summary(columns: ExpenseColumns, year: int, month: int) -> Tuple[float, float, int, Dict[str, float]]:
+        """(total, average per day, distinct days, category breakdown) of one month from a single pass"""
+        if not dt.MINYEAR <= year <= dt.MAXYEAR:
+            # No expense date can fall there, and dt.date() would raise
+            return 0.0, 0.0, 0, {}
+        total, days, cat_totals = _month_agg(
+            columns.month_keys, columns.date_ords, columns.amounts, columns.cat_ids,
+            ExpenseColumns.month_key(year, month), dt.date(year, month, 1).toordinal(),
+            len(columns.cat_names))
+        total, days = float(total), int(days)
+        present = np.flatnonzero(cat_totals)
+        breakdown = dict(zip([columns.cat_names[i] for i in present], cat_totals[present].tolist()))
+        return total, total / (days or 1), days, breakdown
+
+    @staticmethod
+    def category_stats(expenses: ExpenseData) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Names, totals and transaction counts of the categories that occur, as parallel sequences"""
+        columns = Analyzer._columns(expenses)
+        counts = np.bincount(columns.cat_ids, minlength=len(columns.cat_names))
+        present = np.flatnonzero(counts)
+        return [columns.cat_names[i] for i in present], columns.category_totals()[present], counts[present]
+
+    @staticmethod
+    def category_totals(expenses: ExpenseData) -> Tuple[List[str], np.ndarray]:
+        """Names and totals of the categories that occur, as parallel sequences"""
+        names, totals, _ = Analyzer.category_stats(expenses)
+        return names, totals
+
+    @staticmethod
+    def category_breakdown(expenses: ExpenseData) -> Dict[str, float]:
+        names, totals = Analyzer.category_totals(expenses)
+        return dict(zip(names, totals.tolist()))
+
+    @staticmethod
+    def daily_trend(expenses: ExpenseData) -> List[Tuple[dt.date, float]]:
+        columns = Analyzer._columns(expenses)
+        days, day_totals = _daily_sums(columns.date_ords, columns.amounts)
+        return [(dt.date.fromordinal(d), t) for d, t in zip(days.tolist(), day_totals.tolist())]
 
 
 class BudgetManager:
@@ -668,26 +1057,174 @@ class BudgetManager:
 # Analytics Windows (Unchanged)
 # -----------------------------
 
+# Most points the trend line is drawn with; about the canvas width in pixels
+_MAX_TREND_POINTS = 1500
+# Rendered chart images kept across analytics window opens
+_CHART_CACHE_SIZE = 8
+
+# Category palette shared by the pie, bar and table charts
+_CHART_COLORS = ('#0ea5e9', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6',
+                 '#ec4899', '#06b6d4', '#14b8a6', '#f97316', '#6366f1',
+                 '#84cc16', '#f43f5e', '#06b6d4', '#a855f7', '#eab308')
+# The table cycles through the first ten
+_TABLE_COLORS = _CHART_COLORS[:10]
+_PIE_EXPLODE = {n: (0.08,) * n for n in range(len(_CHART_COLORS) + 1)}
+# Rupee amount formatters, bound once
+_FMT2 = "₹{:,.2f}".format
+_FMT0 = "₹{:,.0f}".format
+
+
+@dataclass(slots=True)
+class ChartData:
+    """One month's chart inputs, captured on the Tk thread for the render worker"""
+    version: int
+    year: int
+    month: int
+    cat_names: List[str]
+    cat_totals: np.ndarray
+    cat_counts: np.ndarray
+    trend: List[Tuple[dt.date, float]]
+
 class AnalyticsWindow(tk.Toplevel):
-    def __init__(self, parent, manager: SectionManager, year: int, month: int, chart_type: str, section_info: Dict):
+    # chart_type -> method drawing a ChartData onto self.ax
+    CHART_BUILDERS = {
+        "pie_chart": "_create_pie_chart",
+        "bar_chart": "_create_bar_chart",
+        "trend_chart": "_create_trend_chart",
+        "category_stats": "_create_category_table",
+    }
+
+    def __init__(self, parent, manager: SectionManager, year: int, month: int, chart_type: str, section_info: Dict,
+                 chart_cache: Optional["OrderedDict[tuple, bytes]"] = None):
         super().__init__(parent)
         self.manager = manager
-        self.year = year
-        self.month = month
+        # LRU of rendered PPM images keyed by data version, period, chart type and size
+        self.chart_cache = chart_cache if chart_cache is not None else OrderedDict()
         self.chart_type = chart_type
         self.section_emoji = section_info["emoji"]
         self.section_color = section_info["color"]
-        self.expenses = self.manager.filter_by_month(year, month)
+        self._load_data(year, month)
         
-        self.title(f"{self.section_emoji} {chart_type.replace('_', ' ').title()} - {year}-{month:02d}")
         # Make window fullscreen
         self.state('zoomed')
         self.configure(bg="#f0f4f8")
+        # Hide instead of destroying so the next chart request can reuse the figure
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         
         self._build_header()
         self._build_chart()
         self._build_footer()
 
+    def _load_data(self, year: int, month: int):
+        self.year = year
+        self.month = month
+        # Aggregates are memoised on the manager; the header and footer read the columns
+        self.columns = self.manager.month_columns(year, month)
+        # The worker only ever sees this snapshot, never the manager it could race with
+        self._chart_data = ChartData(self.manager.version, year, month, *self.manager.category_stats(year, month),
+                                     self.manager.daily_trend(year, month))
+        # Data the window currently shows; ExpenseApp compares it before reusing the window
+        self.data_key = (self.manager, year, month, self.manager.version)
+
+    def show_data(self, year: int, month: int):
+        """Point the window at another month or newer data, updating the existing widgets"""
+        # No waiting on the render lock: an in-flight render draws its own snapshot,
+        # and bumping the sequence keeps its result from being shown
+        self._render_seq += 1
+        self._load_data(year, month)
+        self._update_header()
+        self._update_footer()
+        self._schedule_render()
+
+    def _on_close(self):
+        self.grab_release()
+        self.withdraw()
+
+    def show_chart(self, chart_type: str):
+        """Switch to chart_type; the existing figure is redrawn off the Tk thread"""
+        self.chart_type = chart_type
+        chart_title = chart_type.replace('_', ' ').title()
+        self.title(f"{self.section_emoji} {chart_title} - {self.year}-{self.month:02d}")
+        self.chart_title_label.config(text=chart_title)
+        self._schedule_render()
+
+    def _schedule_render(self, _event=None):
+        # Coalesce chart switches and resize bursts into one render
+        if self._render_after is not None:
+            self.after_cancel(self._render_after)
+        self._render_after = self.after(50, self._start_render)
+
+    def _start_render(self):
+        self._render_after = None
+        self._render_seq += 1
+        size = (self.chart_frame.winfo_width(), self.chart_frame.winfo_height())
+        data = self._chart_data
+        key = (data.version, data.year, data.month, self.chart_type, size)
+        ppm = self.chart_cache.get(key)
+        if ppm is not None:
+            self.chart_cache.move_to_end(key)
+            self._show_render(self._render_seq, ppm)
+            return
+        threading.Thread(target=self._render, args=(self._render_seq, key, self.chart_type, size, data),
+                         daemon=True).start()
+        if not self._polling:
+            self._polling = True
+            self._poll_render()
+
+    def _render(self, seq: int, key: tuple, chart_type: str, size: Tuple[int, int], data: ChartData):
+        """Worker thread: draw the figure with Agg and hand back a PPM image or the error"""
+        ppm, error = None, None
+        with self._render_lock:
+            if seq != self._render_seq:
+                return  # superseded while waiting for the previous render
+            try:
+                width, height = size
+                if width > 1 and height > 1:
+                    self.fig.set_size_inches(width / self.fig.dpi, height / self.fig.dpi)
+                # Fresh axes each time: ax.clear() keeps state such as the pie's equal aspect
+                self.fig.clear()
+                self.ax = self.fig.add_subplot(111)
+                getattr(self, self.CHART_BUILDERS[chart_type])(data)
+                self.agg_canvas.draw()
+                width, height = self.agg_canvas.get_width_height()
+                rgb = np.asarray(self.agg_canvas.buffer_rgba())[:, :, :3].tobytes()
+                ppm = b"P6 %d %d 255\n" % (width, height) + rgb
+            except Exception as e:
+                # Still report back, or _poll_render would wait on this render forever
+                error = e
+        self._rendered.put((seq, key, ppm, error))
+
+    def _poll_render(self):
+        if not self.winfo_exists():
+            return
+        failure = None
+        try:
+            while True:
+                seq, key, ppm, error = self._rendered.get_nowait()
+                if error is not None:
+                    if seq == self._render_seq:
+                        self._shown_seq, failure = seq, error
+                    continue
+                # Superseded renders are still valid for their own key
+                self.chart_cache[key] = ppm
+                if len(self.chart_cache) > _CHART_CACHE_SIZE:
+                    self.chart_cache.popitem(last=False)
+                if seq == self._render_seq:
+                    self._show_render(seq, ppm)
+        except queue.Empty:
+            pass
+        if failure is not None:
+            messagebox.showerror("❌ Chart Failed", str(failure), parent=self)
+        if self._shown_seq != self._render_seq:
+            self.after(20, self._poll_render)
+        else:
+            self._polling = False
+
+    def _show_render(self, seq: int, ppm: bytes):
+        # Reload the label's one photo image in place; it resizes to the data
+        self.chart_image.configure(data=ppm, format="PPM")
+        self._shown_seq = seq
+
     def _build_header(self):
         # Compact header optimized to fit accurately
         header_frame = tk.Frame(self, bg=self.section_color, height=70)
@@ -717,10 +1254,11 @@ class AnalyticsWindow(tk.Toplevel):
         text_section = tk.Frame(left_section, bg=self.section_color)
         text_section.pack(side="left", fill="y")
         
-        tk.Label(text_section, text=f"{self.chart_type.replace('_', ' ').title()}", 
-                font=("Segoe UI", 16, "bold"), fg="white", bg=self.section_color).pack(anchor="w", pady=(1, 0))
-        tk.Label(text_section, text=f"📅 {self.year}-{self.month:02d} Analysis | Daily Breakdown", 
-                font=("Segoe UI", 9), fg="#e0f2fe", bg=self.section_color).pack(anchor="w")
+        self.chart_title_label = tk.Label(text_section, font=("Segoe UI", 16, "bold"), 
+                                          fg="white", bg=self.section_color)
+        self.chart_title_label.pack(anchor="w", pady=(1, 0))
+        self._period_label = tk.Label(text_section, font=("Segoe UI", 9), fg="#e0f2fe", bg=self.section_color)
+        self._period_label.pack(anchor="w")
         
         # Right side - Quick stats badge
         right_section = tk.Frame(content_frame, bg=self.section_color)
@@ -733,13 +1271,18 @@ class AnalyticsWindow(tk.Toplevel):
         badge_inner = tk.Frame(stats_badge, bg="#0f3460")
         badge_inner.pack(padx=10, pady=5)
         
-        total = sum(e.amount for e in self.expenses)
         tk.Label(badge_inner, text="Total Expenses", 
                 font=("Segoe UI", 7), fg="#94a3b8", bg="#0f3460").pack()
-        tk.Label(badge_inner, text=f"₹{total:,.0f}", 
-                font=("Segoe UI", 13, "bold"), fg="#00d4ff", bg="#0f3460").pack()
-        tk.Label(badge_inner, text=f"{len(self.expenses)} Txns", 
-                font=("Segoe UI", 6), fg="#cbd5e1", bg="#0f3460").pack()
+        self._badge_total_label = tk.Label(badge_inner, font=("Segoe UI", 13, "bold"), fg="#00d4ff", bg="#0f3460")
+        self._badge_total_label.pack()
+        self._badge_count_label = tk.Label(badge_inner, font=("Segoe UI", 6), fg="#cbd5e1", bg="#0f3460")
+        self._badge_count_label.pack()
+        self._update_header()
+
+    def _update_header(self):
+        self._period_label.config(text=f"📅 {self.year}-{self.month:02d} Analysis | Daily Breakdown")
+        self._badge_total_label.config(text=_FMT0(float(self.columns.amounts.sum())))
+        self._badge_count_label.config(text=f"{len(self.columns)} Txns")
 
     def _build_chart(self):
         # Main container optimized for fullscreen without scrollbars
@@ -757,25 +1300,32 @@ class AnalyticsWindow(tk.Toplevel):
         accent_bar = tk.Frame(chart_card, bg=self.section_color, height=4)
         accent_bar.pack(fill="x")
         
-        # Chart frame with optimized padding for perfect fullscreen fit
-        chart_frame = tk.Frame(chart_card, bg="white")
-        chart_frame.pack(fill="both", expand=True, padx=20, pady=15)
-        
-        # Create figure optimized for fullscreen display without scrolling
-        self.fig = Figure(figsize=(17, 8.5), facecolor="white", dpi=85)
-        
-        if self.chart_type == "pie_chart":
-            self._create_pie_chart()
-        elif self.chart_type == "bar_chart":
-            self._create_bar_chart()
-        elif self.chart_type == "trend_chart":
-            self._create_trend_chart()
-        elif self.chart_type == "category_stats":
-            self._create_category_table()
-        
-        self.canvas = FigureCanvasTkAgg(self.fig, chart_frame)
-        self.canvas.get_tk_widget().pack(fill="both", expand=True)
-        self.canvas.draw()
+        # One figure, axes and Agg canvas for the window's lifetime. Rendering runs on a
+        # worker thread; finished images come back through a queue polled from Tk.
+        Figure, FigureCanvasAgg = _load_matplotlib()
+        self.fig = Figure(figsize=(17, 8.5), facecolor="white", dpi=72)
+        self.ax = self.fig.add_subplot(111)
+        self.agg_canvas = FigureCanvasAgg(self.fig)
+        width, height = self.agg_canvas.get_width_height()
+        
+        # Chart frame with optimized padding for perfect fullscreen fit; it asks for the
+        # figure's size but is sized by the layout, never by the rendered image
+        self.chart_frame = tk.Frame(chart_card, bg="white", width=width, height=height)
+        self.chart_frame.pack(fill="both", expand=True, padx=20, pady=15)
+        self.chart_frame.pack_propagate(False)
+        # Static charts need no FigureCanvasTkAgg: a label shows one photo image reused per render
+        self.chart_image = tk.PhotoImage()
+        self.chart_label = tk.Label(self.chart_frame, bg="white", image=self.chart_image)
+        self.chart_label.pack(fill="both", expand=True)
+        self.chart_frame.bind("<Configure>", self._schedule_render)
+        
+        self._render_lock = threading.Lock()
+        self._rendered: "queue.Queue[Tuple[int, tuple, Optional[bytes], Optional[Exception]]]" = queue.Queue()
+        self._render_seq = 0
+        self._shown_seq = 0
+        self._render_after = None
+        self._polling = False
+        self.show_chart(self.chart_type)
 
     def _build_footer(self):
         # Modern footer optimized for fullscreen
@@ -793,19 +1343,16 @@ class AnalyticsWindow(tk.Toplevel):
         content = tk.Frame(footer_frame, bg="#1e293b")
         content.pack(expand=True, fill="both", padx=50, pady=10)
         
-        total = sum(e.amount for e in self.expenses)
-        days_recorded = len(set(e.date for e in self.expenses))
-        avg_per_day = total / days_recorded if days_recorded > 0 else 0
-        
-        # Create compact stat cards
+        # Create compact stat cards once; _update_footer fills in the values
         stats = [
-            ("💰", "Total Spent", f"₹{total:,.2f}", "#00d4ff"),
-            ("📅", "Transactions", str(len(self.expenses)), "#10b981"),
-            ("📊", "Days Recorded", str(days_recorded), "#f59e0b"),
-            ("📈", "Avg per Day", f"₹{avg_per_day:,.2f}", "#8b5cf6")
+            ("💰", "Total Spent", "#00d4ff"),
+            ("📅", "Transactions", "#10b981"),
+            ("📊", "Days Recorded", "#f59e0b"),
+            ("📈", "Avg per Day", "#8b5cf6")
         ]
         
-        for icon, label, value, color in stats:
+        self._stat_value_labels: List[tk.Label] = []
+        for icon, label, color in stats:
             stat_card = tk.Frame(content, bg="#0f3460", relief="flat")
             stat_card.pack(side="left", padx=12, fill="y", expand=True)
             
@@ -822,28 +1369,35 @@ class AnalyticsWindow(tk.Toplevel):
             
             tk.Label(text_section, text=label, font=("Segoe UI", 8), 
                     fg="#94a3b8", bg="#0f3460").pack(anchor="w")
-            tk.Label(text_section, text=value, font=("Segoe UI", 13, "bold"), 
-                    fg=color, bg="#0f3460").pack(anchor="w")
-
-    def _create_pie_chart(self):
-        breakdown = Analyzer.category_breakdown(self.expenses)
-        self.ax = self.fig.add_subplot(111)
-        if breakdown:
-            labels = list(breakdown.keys())
-            sizes = list(breakdown.values())
-            # Professional gradient color palette
-            colors = ['#0ea5e9', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6', 
-                     '#ec4899', '#06b6d4', '#14b8a6', '#f97316', '#6366f1',
-                     '#84cc16', '#f43f5e', '#06b6d4', '#a855f7', '#eab308']
-            colors = colors[:len(labels)]
+            value_label = tk.Label(text_section, font=("Segoe UI", 13, "bold"), 
+                                   fg=color, bg="#0f3460")
+            value_label.pack(anchor="w")
+            self._stat_value_labels.append(value_label)
+        self._update_footer()
+
+    def _update_footer(self):
+        total = float(self.columns.amounts.sum())
+        days_recorded = Analyzer._distinct_days(self.columns.date_ords)
+        avg_per_day = total / days_recorded if days_recorded > 0 else 0
+        values = (_FMT2(total), str(len(self.columns)), str(days_recorded), _FMT2(avg_per_day))
+        for value_label, value in zip(self._stat_value_labels, values):
+            value_label.config(text=value)
+
+    def _create_pie_chart(self, data: ChartData):
+        if data.cat_names:
+            sizes = data.cat_totals
+            # Percentages go straight into the labels: one text per wedge, no autopct pass
+            percents = (100 * sizes / sizes.sum()).tolist()
+            labels = [f"{name}\n{pct:.1f}%" for name, pct in zip(data.cat_names, percents)]
+            colors = _CHART_COLORS[:len(labels)]
             
-            # Create pie chart with enhanced visual effects
-            wedges, texts, autotexts = self.ax.pie(sizes, labels=labels, autopct='%1.1f%%', 
-                                                  startangle=90, colors=colors, 
-                                                  textprops={'fontsize': 14, 'fontweight': 'bold'},
-                                                  explode=[0.08]*len(labels),
-                                                  shadow=True,
-                                                  wedgeprops={'edgecolor': 'white', 'linewidth': 3, 'antialiased': True})            
+            # Create pie chart; no shadow, which would draw every wedge twice
+            wedges, texts = self.ax.pie(sizes, labels=labels, autopct=None,
+                                        startangle=90, colors=colors,
+                                        textprops={'fontsize': 14, 'fontweight': 'bold'},
+                                        explode=_PIE_EXPLODE.get(len(labels)) or (0.08,) * len(labels),
+                                        shadow=False,
+                                        wedgeprops={'edgecolor': 'white', 'linewidth': 3, 'antialiased': True})
   
             
             # Adjust subplot position
@@ -856,44 +1410,33 @@ class AnalyticsWindow(tk.Toplevel):
                             bbox=dict(boxstyle='round,pad=0.8', facecolor='#f0f4f8', edgecolor='none'))
             self.fig.subplots_adjust(top=0.90, bottom=0.05, left=0.05, right=0.95)
 
-    def _create_bar_chart(self):
-        breakdown = Analyzer.category_breakdown(self.expenses)
-        self.ax = self.fig.add_subplot(111)
-        if breakdown:
-            categories = list(breakdown.keys())
-            amounts = list(breakdown.values())
-            # Professional gradient colors
-            colors = ['#0ea5e9', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6', 
-                     '#ec4899', '#06b6d4', '#14b8a6', '#f97316', '#6366f1',
-                     '#84cc16', '#f43f5e', '#06b6d4', '#a855f7', '#eab308']
-            colors = colors[:len(categories)]
+    def _create_bar_chart(self, data: ChartData):
+        from matplotlib.artist import setp
+        if data.cat_names:
+            categories = data.cat_names
+            amounts = data.cat_totals.tolist()
+            colors = _CHART_COLORS[:len(categories)]
             
             # Create bars with gradient effect
             bars = self.ax.bar(categories, amounts, color=colors, edgecolor='#1e293b', 
                              linewidth=2.5, alpha=0.85, width=0.7)
             
-            # Add gradient effect to bars
-            for bar, color in zip(bars, colors):
-                bar.set_linewidth(2.5)
-                bar.set_edgecolor('#1e293b')
-            
             self.ax.set_title('Spending by Category', fontsize=22, fontweight='bold', 
                             pad=35, color='#1e293b',
                             bbox=dict(boxstyle='round,pad=0.6', facecolor='#f0f4f8', edgecolor='none'))
             self.ax.set_ylabel('Amount (₹)', fontsize=16, fontweight='bold', color='#1e293b', labelpad=12)
             self.ax.set_xlabel('Categories', fontsize=16, fontweight='bold', color='#1e293b', labelpad=12)
-            plt.setp(self.ax.xaxis.get_majorticklabels(), rotation=45, ha='right', fontsize=12, fontweight='bold')
+            setp(self.ax.xaxis.get_majorticklabels(), rotation=45, ha='right', fontsize=12, fontweight='bold')
             self.ax.tick_params(axis='y', labelsize=12)
             self.ax.grid(axis='y', alpha=0.25, linestyle='--', linewidth=1.5, color='#cbd5e1')
             self.ax.set_axisbelow(True)
             
-            # Add professional value labels with background
-            for bar, amount in zip(bars, amounts):
-                height = bar.get_height()
-                self.ax.text(bar.get_x() + bar.get_width()/2., height + max(amounts)*0.02,
-                           f'₹{amount:,.0f}', ha='center', va='bottom', 
-                           fontweight='bold', fontsize=12, color='#1e293b',
-                           bbox=dict(boxstyle='round,pad=0.3', facecolor='#fef08a', alpha=0.8, edgecolor='none'))
+            # Add professional value labels with background; positions computed in one go
+            tops = data.cat_totals + data.cat_totals.max() * 0.02
+            label_bbox = dict(boxstyle='round,pad=0.3', facecolor='#fef08a', alpha=0.8, edgecolor='none')
+            for x, top, amount in zip(range(len(amounts)), tops.tolist(), amounts):
+                self.ax.text(x, top, _FMT0(amount), ha='center', va='bottom', 
+                           fontweight='bold', fontsize=12, color='#1e293b', bbox=label_bbox)
             
             # Adjust layout for perfect fit
             self.fig.subplots_adjust(top=0.88, bottom=0.16, left=0.10, right=0.95)
@@ -905,24 +1448,31 @@ class AnalyticsWindow(tk.Toplevel):
                             bbox=dict(boxstyle='round,pad=0.8', facecolor='#f0f4f8', edgecolor='none'))
             self.fig.subplots_adjust(top=0.90, bottom=0.05, left=0.05, right=0.95)
 
-    def _create_trend_chart(self):
+    def _create_trend_chart(self, data: ChartData):
         import matplotlib.dates as mdates
-        trend = Analyzer.daily_trend(self.expenses)
-        self.ax = self.fig.add_subplot(111)
+        from matplotlib.artist import setp
+        from matplotlib.ticker import FuncFormatter
+        trend = data.trend
         if trend:
             dates = [t[0] for t in trend]
-            amounts = [t[1] for t in trend]
+            amounts = np.fromiter((t[1] for t in trend), dtype=np.float64, count=len(trend))
+            # Average and annotations use every day; the line itself is decimated
+            # so draw cost stays bounded by the canvas width
+            plot_dates, plot_amounts = dates, amounts
+            if amounts.size > _MAX_TREND_POINTS:
+                keep = np.linspace(0, amounts.size - 1, _MAX_TREND_POINTS).astype(np.intp)
+                plot_dates, plot_amounts = [dates[i] for i in keep], amounts[keep]
             
             # Create professional gradient line chart
-            self.ax.plot(dates, amounts, 'o-', linewidth=4, markersize=14, color='#0ea5e9', 
+            self.ax.plot(plot_dates, plot_amounts, 'o-', linewidth=4, markersize=14, color='#0ea5e9', 
                         markerfacecolor='#0ea5e9', markeredgecolor='white', markeredgewidth=4,
                         label='Daily Spending', zorder=3, alpha=0.9)
             
             # Add enhanced gradient fill
-            self.ax.fill_between(dates, amounts, alpha=0.25, color='#0ea5e9')
+            self.ax.fill_between(plot_dates, plot_amounts, alpha=0.25, color='#0ea5e9')
             
             # Add professional average line
-            avg_amount = sum(amounts) / len(amounts)
+            avg_amount = float(amounts.mean())
             self.ax.axhline(y=avg_amount, color='#10b981', linestyle='--', linewidth=3, 
                           label=f'Average: ₹{avg_amount:,.2f}', alpha=0.8, zorder=2)
             
@@ -938,30 +1488,30 @@ class AnalyticsWindow(tk.Toplevel):
             # Professional date formatting
             self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%d-%b'))
             self.ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates)//10)))
-            plt.setp(self.ax.xaxis.get_majorticklabels(), rotation=45, ha='right', fontsize=12, fontweight='bold')
+            setp(self.ax.xaxis.get_majorticklabels(), rotation=45, ha='right', fontsize=12, fontweight='bold')
             self.ax.tick_params(axis='y', labelsize=12)
             
             self.ax.legend(fontsize=12, loc='upper right', framealpha=0.95, shadow=True,
                          fancybox=True, borderpad=1)
             
             # Enhanced data point labels
-            max_amount = max(amounts)
-            min_amount = min(amounts)
-            for date, amount in zip(dates, amounts):
-                if amount == max_amount or amount == min_amount:
-                    self.ax.annotate(f'₹{amount:,.0f}', 
-                                   xy=(date, amount), 
-                                   xytext=(0, 18 if amount == max_amount else -28),
-                                   textcoords='offset points',
-                                   ha='center',
-                                   fontsize=11,
-                                   fontweight='bold',
-                                   color='#1e293b',
-                                   bbox=dict(boxstyle='round,pad=0.4', facecolor='#fef08a', 
-                                           alpha=0.95, edgecolor='#1e293b', linewidth=1.5))
+            max_amount = amounts.max()
+            min_amount = amounts.min()
+            for i in np.flatnonzero((amounts == max_amount) | (amounts == min_amount)):
+                date, amount = dates[i], float(amounts[i])
+                self.ax.annotate(_FMT0(amount), 
+                               xy=(date, amount), 
+                               xytext=(0, 18 if amount == max_amount else -28),
+                               textcoords='offset points',
+                               ha='center',
+                               fontsize=11,
+                               fontweight='bold',
+                               color='#1e293b',
+                               bbox=dict(boxstyle='round,pad=0.4', facecolor='#fef08a', 
+                                       alpha=0.95, edgecolor='#1e293b', linewidth=1.5))
             
             # Format y-axis
-            self.ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'₹{x:,.0f}'))
+            self.ax.yaxis.set_major_formatter(FuncFormatter(lambda x, p: _FMT0(x)))
             
             # Adjust layout for perfect fit
             self.fig.subplots_adjust(top=0.88, bottom=0.16, left=0.10, right=0.95)
@@ -973,25 +1523,21 @@ class AnalyticsWindow(tk.Toplevel):
                             bbox=dict(boxstyle='round,pad=0.6', facecolor='#f0f4f8', edgecolor='none'))
             self.fig.subplots_adjust(top=0.88, bottom=0.05, left=0.05, right=0.95)
 
-    def _create_category_table(self):
-        breakdown = Analyzer.category_breakdown(self.expenses)
-        summary = Analyzer.monthly_summary(self.expenses)
-        
-        self.ax = self.fig.add_subplot(111)
+    def _create_category_table(self, data: ChartData):
         self.ax.axis('off')
         table_data = [["Category", "Amount", "Percentage", "Transactions"]]
         
-        if breakdown:
-            total = summary['total']
-            # Count transactions per category
-            category_count = defaultdict(int)
-            for e in self.expenses:
-                category_count[e.category] += 1
+        if data.cat_names:
+            total = float(data.cat_totals.sum())
+            totals = data.cat_totals.tolist()
+            # Transactions per category come from one bincount
+            counts = data.cat_counts.tolist()
             
-            for cat, amt in sorted(breakdown.items(), key=lambda x: x[1], reverse=True):
+            # Largest total first; stable so ties keep category order
+            for i in np.argsort(-data.cat_totals, kind="stable").tolist():
+                amt = totals[i]
                 pct = (amt/total*100) if total > 0 else 0
-                count = category_count[cat]
-                table_data.append([cat, f"₹{amt:,.2f}", f"{pct:.1f}%", str(count)])
+                table_data.append([data.cat_names[i], _FMT2(amt), f"{pct:.1f}%", str(counts[i])])
         else:
             table_data.append(["No data", "", "", ""])
         
@@ -1001,10 +1547,6 @@ class AnalyticsWindow(tk.Toplevel):
         table.set_fontsize(14)
         table.scale(1.3, 3)
         
-        # Professional color scheme
-        colors = ['#0ea5e9', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6', 
-                 '#ec4899', '#06b6d4', '#14b8a6', '#f97316', '#6366f1']
-        
         for i in range(len(table_data)):
             for j in range(4):
                 cell = table[(i, j)]
@@ -1027,8 +1569,8 @@ class AnalyticsWindow(tk.Toplevel):
                     
                     # Add color indicator to first column
                     if j == 0 and i > 0:
-                        color_idx = (i - 1) % len(colors)
-                        cell.set_facecolor(colors[color_idx])
+                        color_idx = (i - 1) % len(_TABLE_COLORS)
+                        cell.set_facecolor(_TABLE_COLORS[color_idx])
                         cell.set_text_props(color='white', weight='bold', fontsize=13)
         
         self.ax.set_title('Category Spending Analysis', fontsize=22, fontweight='bold', 
@@ -1042,6 +1584,26 @@ class AnalyticsWindow(tk.Toplevel):
 # Main GUI Layer with Sections + NEW IMPORT BUTTON
 # -----------------------------
 
+# Inserting more rows than this unmaps the expense table until they are in
+_TREE_DETACH_ROWS = 50
+# Expense table rows materialised per page; the table shows about 20 at once
+_TREE_PAGE_ROWS = 100
+# Expense form dates; anything else is rejected before a date object is attempted
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+# Tcl helper that inserts a flat list of iid/values pairs in one call from Python
+_TREE_INSERT_PROC = "hms_tree_insert"
+_TREE_INSERT_SCRIPT = (f"proc {_TREE_INSERT_PROC} {{tree rows}} "
+                       "{foreach {iid values} $rows {$tree insert {} end -id $iid -values $values}}")
+
+
+def _csv_quote(value: str) -> str:
+    """Quote a field the way csv.writer's default dialect would"""
+    if '"' in value:
+        return '"' + value.replace('"', '""') + '"'
+    if "," in value or "\n" in value or "\r" in value:
+        return '"' + value + '"'
+    return value
+
 class ExpenseApp(tk.Tk):
     def __init__(self, user_data: Dict):
         super().__init__()
@@ -1065,9 +1627,19 @@ class ExpenseApp(tk.Tk):
         self.multi_storage = MultiFileStorage(self.username)
         self.current_section = "personal"
         self.current_manager: Optional[SectionManager] = None
+        # One manager per section for the session, so its caches and data version survive switching away
+        self._managers: Dict[str, SectionManager] = {}
         self.current_year = dt.date.today().year
         self.current_month = dt.date.today().month
         self.selected_expense_id: Optional[int] = None
+        # Last analytics window, kept hidden between opens so its figure can be reused
+        self._analytics_window: Optional[AnalyticsWindow] = None
+        # Rendered chart images shared by every analytics window this session
+        self._chart_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+        # Pending after() id of a debounced filter refresh
+        self._pending_refresh: Optional[str] = None
+        # Set when a summary refresh was skipped because the window was not showing
+        self._summary_dirty = False
 
         # Modern navigation bar colors
         self.nav_bg = "#1e293b"
@@ -1083,17 +1655,30 @@ class ExpenseApp(tk.Tk):
         
         # Handle window close
         self.protocol("WM_DELETE_WINDOW", self._on_close)
+        # Render a summary deferred while minimised once the window is back
+        self.bind("<Map>", self._on_map, add="+")
     
+    def _on_map(self, _event):
+        if self._summary_dirty:
+            self._refresh_summary()
+
     def _on_close(self):
         """Handle application close"""
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
             self.auth_manager.logout()
             self.destroy()
 
+    def _get_manager(self, section: str) -> SectionManager:
+        if section not in self._managers:
+            self._managers[section] = SectionManager(self.multi_storage, section, self.username)
+        return self._managers[section]
+
     def _switch_section(self, section: str):
         self.current_section = section
-        self.current_manager = SectionManager(self.multi_storage, section, self.username)
+        self.current_manager = self._get_manager(section)
         self.section_info = self.multi_storage.get_section_info(section)
+        self.section_emoji = self.section_info["emoji"]
+        self.section_label = self.section_info["label"]
 
     def _build_ui(self):
         # Main container
@@ -1171,16 +1756,18 @@ class ExpenseApp(tk.Tk):
                            cursor="hand2", padx=15)
             btn.pack(side="left", fill="both", expand=True, padx=3)
             
-            # Enhanced hover effects with shadow simulation
-            def on_enter(e, b=btn, c=info['color']):
-                b.config(bg="#0ea5e9", font=("Segoe UI", 13, "bold"))
-            def on_leave(e, b=btn, c=info['color']):
-                b.config(bg=c, font=("Segoe UI", 13, "bold"))
-            
-            btn.bind("<Enter>", on_enter)
-            btn.bind("<Leave>", on_leave)
+            # Hover effects share two handlers; each button carries its own resting colour
+            btn._bg_normal = info['color']
+            btn.bind("<Enter>", self._on_section_enter)
+            btn.bind("<Leave>", self._on_section_leave)
             
             self.section_buttons[section_key] = btn
+
+    def _on_section_enter(self, event):
+        event.widget.config(bg="#0ea5e9")
+
+    def _on_section_leave(self, event):
+        event.widget.config(bg=event.widget._bg_normal)
     
     def _on_logout(self):
         """Handle logout"""
@@ -1211,7 +1798,7 @@ class ExpenseApp(tk.Tk):
         header_container = tk.Frame(nav_frame, bg=self.nav_bg)
         header_container.pack(pady=25, padx=20, fill="x")
         
-        tk.Label(header_container, text=f"{self.section_info['emoji']}", 
+        tk.Label(header_container, text=f"{self.section_emoji}", 
                 font=("Segoe UI", 36), fg="#0ea5e9", bg=self.nav_bg).pack()
         tk.Label(header_container, text="Analytics Dashboard", 
                 font=("Segoe UI", 12, "bold"), fg="#e0f2fe", bg=self.nav_bg).pack(pady=(10, 0))
@@ -1236,14 +1823,9 @@ class ExpenseApp(tk.Tk):
                            cursor="hand2", anchor="w", padx=20)
             btn.pack(fill="x", padx=15, pady=5)
             
-            # Enhanced hover effect
-            def on_enter(e, b=btn):
-                b.config(bg=self.nav_hover, fg="white")
-            def on_leave(e, b=btn):
-                b.config(bg=self.nav_bg, fg="#cbd5e1")
-            
-            btn.bind("<Enter>", on_enter)
-            btn.bind("<Leave>", on_leave)
+            # Enhanced hover effect, one shared handler pair for every button
+            btn.bind("<Enter>", self._on_nav_enter)
+            btn.bind("<Leave>", self._on_nav_leave)
             
             self.nav_buttons[chart_type] = btn
         
@@ -1252,6 +1834,12 @@ class ExpenseApp(tk.Tk):
         footer_info = tk.Label(nav_frame, text=f"📅 {dt.date.today().strftime('%B %Y')}", 
                               font=("Segoe UI", 10), fg="#64748b", bg=self.nav_bg)
         footer_info.pack(side="bottom", pady=10)
+
+    def _on_nav_enter(self, event):
+        event.widget.config(bg=self.nav_hover, fg="white")
+
+    def _on_nav_leave(self, event):
+        event.widget.config(bg=self.nav_bg, fg="#cbd5e1")
     
     def _on_nav_button_click(self, chart_type: str):
         """Handle navigation button clicks"""
@@ -1262,9 +1850,21 @@ class ExpenseApp(tk.Tk):
 
     def _open_analytics_window(self, chart_type: str):
         if self.current_manager:
-            window = AnalyticsWindow(self, self.current_manager, self.current_year, self.current_month, 
-                                   chart_type, self.section_info)
-            window.transient(self)
+            window = self._analytics_window
+            data_key = (self.current_manager, self.current_year, self.current_month, self.current_manager.version)
+            if window is not None and window.winfo_exists() and window.manager is self.current_manager:
+                # Same section: refresh the existing widgets rather than building new ones
+                if window.data_key != data_key:
+                    window.show_data(self.current_year, self.current_month)
+                window.deiconify()
+                window.show_chart(chart_type)
+            else:
+                if window is not None and window.winfo_exists():
+                    window.destroy()
+                window = AnalyticsWindow(self, self.current_manager, self.current_year, self.current_month, 
+                                       chart_type, self.section_info, self._chart_cache)
+                window.transient(self)
+                self._analytics_window = window
             window.grab_set()
     
     def _open_bulk_import_window(self):
@@ -1341,17 +1941,20 @@ class ExpenseApp(tk.Tk):
                 import_data = SectionManager.parse_csv_file(filepath)
                 status_label.config(text=f"Loaded {len(import_data)} rows", fg="green")
                 
-                # Show first 50 rows
-                for item in preview_tree.get_children():
-                    preview_tree.delete(item)
-                
-                for expense in import_data[:50]:
-                    preview_tree.insert("", "end", values=(
-                        expense['date'], 
-                        expense['category'][:20], 
-                        expense['description'][:25], 
-                        f"₹{expense['amount']:.2f}"
-                    ))
+                # Show first 50 rows, formatted up front
+                rows = [
+                    (expense['date'], expense['category'][:20], expense['description'][:25],
+                     f"₹{expense['amount']:.2f}")
+                    for expense in import_data[:50]
+                ]
+                # Unmap the tree while refilling so it lays out once, not per row
+                preview_tree.pack_forget()
+                children = preview_tree.get_children()
+                if children:
+                    preview_tree.delete(*children)
+                for values in rows:
+                    preview_tree.insert("", "end", values=values)
+                preview_tree.pack(side="left", fill="both", expand=True, before=vsb)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load file: {str(e)}")
         
@@ -1381,7 +1984,7 @@ class ExpenseApp(tk.Tk):
                 return
             
             section = section_var.get()
-            manager = SectionManager(self.multi_storage, section, self.username)
+            manager = self._get_manager(section)
             
             success_count, skipped_count = manager.bulk_add_expenses(valid_data)
             
@@ -1403,7 +2006,7 @@ class ExpenseApp(tk.Tk):
         ttk.Button(btn_frame, text="❌ Cancel", command=window.destroy).pack(side="left", padx=5)
 
     def _build_top_controls(self, parent):
-        frame = ttk.LabelFrame(parent, text=f"🔍 Filters & Export - {self.section_info['emoji']} {self.section_info['label']}", padding=10)
+        frame = ttk.LabelFrame(parent, text=f"🔍 Filters & Export - {self.section_emoji} {self.section_label}", padding=10)
         frame.pack(fill="x", pady=(0, 10))
 
         ttk.Label(frame, text="Year:").grid(row=0, column=0, sticky="w", padx=(0, 5))
@@ -1456,6 +2059,7 @@ class ExpenseApp(tk.Tk):
 
         columns = ("id", "date", "category", "description", "amount")
         self.tree = ttk.Treeview(frame, columns=columns, show="headings", height=20)
+        self.tk.eval(_TREE_INSERT_SCRIPT)
         
         for col in columns:
             self.tree.heading(col, text=col.capitalize())
@@ -1463,13 +2067,20 @@ class ExpenseApp(tk.Tk):
         
         vsb = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscroll=vsb.set, xscroll=hsb.set)
+        self.tree.configure(yscroll=self._on_tree_scroll, xscroll=hsb.set)
         
         self.tree.pack(side="left", fill="both", expand=True)
         vsb.pack(side="right", fill="y")
         hsb.pack(side="bottom", fill="x")
+        self._tree_vsb = vsb
         
         self.tree.bind("<<TreeviewSelect>>", self._on_select_row)
+        # Values currently shown, keyed by item id (the expense id)
+        self._tree_rows: Dict[str, tuple] = {}
+        # The month being listed, and how many of its rows are in the tree
+        self._filtered: List[Expense] = []
+        self._tree_view = None
+        self._tree_limit = _TREE_PAGE_ROWS
 
     def _build_budget_controls(self, parent):
         self.budget_frame = ttk.LabelFrame(parent, text="💳 Budget Management", padding=12)
@@ -1534,7 +2145,13 @@ class ExpenseApp(tk.Tk):
 
     def _refresh_all(self):
         self._refresh_categories()
-        self._refresh_table()
+        self._refresh_month()
+
+    def _refresh_month(self):
+        """Refresh the table and summary from a single filter of the current month"""
+        expenses = (self.current_manager.filter_by_month(self.current_year, self.current_month)
+                    if self.current_manager else [])
+        self._refresh_table(expenses)
         self._refresh_summary()
 
     def _refresh_categories(self):
@@ -1551,25 +2168,33 @@ class ExpenseApp(tk.Tk):
             month = int(self.month_var.get())
             if not (1 <= month <= 12):
                 raise ValueError("Month must be between 1 and 12.")
-            self.current_year, self.current_month = year, month
-            self._refresh_table()
-            self._refresh_summary()
         except ValueError as e:
             messagebox.showerror("❌ Invalid Filter", str(e))
+            return
+        if (year, month) == (self.current_year, self.current_month):
+            return
+        self.current_year, self.current_month = year, month
+        # Coalesce repeated filter clicks into one refresh of the last month asked for
+        if self._pending_refresh is not None:
+            self.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.after(100, self._do_refresh)
+
+    def _do_refresh(self):
+        self._pending_refresh = None
+        self._refresh_month()
 
     def _on_reset_filter(self):
         today = dt.date.today()
         self.year_var.set(str(today.year))
         self.month_var.set(str(today.month))
         self.current_year, self.current_month = today.year, today.month
-        self._refresh_table()
-        self._refresh_summary()
+        self._refresh_month()
 
     def _on_export(self):
         if not self.current_manager:
             return
-        expenses = self.current_manager.filter_by_month(self.current_year, self.current_month)
-        if not expenses:
+        n_rows = self.current_manager.count_by_month(self.current_year, self.current_month)
+        if not n_rows:
             messagebox.showinfo("📤 Export", "No expenses for selected month.")
             return
         filename = f"{self.current_section}_{self.current_year}_{self.current_month:02d}_expenses.csv"
@@ -1577,15 +2202,38 @@ class ExpenseApp(tk.Tk):
                                           filetypes=[("CSV files", "*.csv")],
                                           initialfilename=filename)
         if path:
-            try:
-                with open(path, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.writer(f)
-                    writer.writerow(["id", "date", "category", "description", "amount"])
-                    for e in expenses:
-                        writer.writerow(e.to_row())
-                messagebox.showinfo("✅ Export Success", f"Exported {len(expenses)} records!")
-            except Exception as e:
-                messagebox.showerror("❌ Export Failed", str(e))
+            # Snapshot the month on the Tk thread; the worker only formats and writes
+            expenses = self.current_manager.filter_by_month(self.current_year, self.current_month)
+            results: "queue.Queue[Optional[Exception]]" = queue.Queue()
+            # Not a daemon, so closing the app mid-export still finishes the file
+            threading.Thread(target=self._write_export, args=(path, expenses, results)).start()
+            self._poll_export(results, len(expenses))
+
+    @staticmethod
+    def _write_export(path: str, expenses: List[Expense], results: "queue.Queue[Optional[Exception]]"):
+        try:
+            with open(path, "w", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
+                # Fixed schema, so lines are formatted directly; only the text fields can need quoting
+                f.write("id,date,category,description,amount\r\n")
+                f.writelines(
+                    f"{e.id},{e.date.isoformat()},{_csv_quote(e.category)},"
+                    f"{_csv_quote(e.description)},{e.amount:.2f}\r\n"
+                    for e in expenses)
+        except Exception as e:
+            results.put(e)
+        else:
+            results.put(None)
+
+    def _poll_export(self, results: "queue.Queue[Optional[Exception]]", n_rows: int):
+        try:
+            error = results.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_export, results, n_rows)
+            return
+        if error is None:
+            messagebox.showinfo("✅ Export Success", f"Exported {n_rows} records!")
+        else:
+            messagebox.showerror("❌ Export Failed", str(error))
 
     def _on_add_category(self):
         def commit():
@@ -1628,7 +2276,7 @@ class ExpenseApp(tk.Tk):
             exp = self.current_manager.add_expense(date, category, desc, amount)
             self._refresh_all()
             self._clear_form()
-            messagebox.showinfo("✅ Added", f"{self.section_info['emoji']} Expense #{exp.id} added!")
+            messagebox.showinfo("✅ Added", f"{self.section_emoji} Expense #{exp.id} added!")
 
     def _on_update(self):
         if not self.current_manager or self.selected_expense_id is None:
@@ -1640,7 +2288,7 @@ class ExpenseApp(tk.Tk):
             if self.current_manager.update_expense(self.selected_expense_id, date, category, desc, amount):
                 self._refresh_all()
                 self._clear_form()
-                messagebox.showinfo("✅ Updated", f"{self.section_info['emoji']} Expense updated!")
+                messagebox.showinfo("✅ Updated", f"{self.section_emoji} Expense updated!")
             else:
                 messagebox.showerror("❌ Update Failed", "Record not found.")
 
@@ -1652,7 +2300,7 @@ class ExpenseApp(tk.Tk):
             if self.current_manager.delete_expense(self.selected_expense_id):
                 self._refresh_all()
                 self._clear_form()
-                messagebox.showinfo("✅ Deleted", f"{self.section_info['emoji']} Expense deleted!")
+                messagebox.showinfo("✅ Deleted", f"{self.section_emoji} Expense deleted!")
             else:
                 messagebox.showerror("❌ Delete Failed", "Record not found.")
 
@@ -1667,9 +2315,15 @@ class ExpenseApp(tk.Tk):
             self.amount_var.set(str(values[4]))
 
     def _validate_form(self) -> Optional[Tuple[dt.date, str, str, float]]:
-        try:
-            date = dt.date.fromisoformat(self.date_var.get().strip())
-        except ValueError:
+        date = None
+        match = _DATE_RE.fullmatch(self.date_var.get().strip())
+        if match:
+            try:
+                date = dt.date(int(match[1]), int(match[2]), int(match[3]))
+            except ValueError:
+                # Well-formed but impossible, e.g. 2024-02-30
+                pass
+        if date is None:
             messagebox.showerror("❌ Invalid Date", "Use YYYY-MM-DD format.")
             return None
         
@@ -1712,40 +2366,87 @@ class ExpenseApp(tk.Tk):
                 e for e in expenses
                 if e.date.year == self.current_year and e.date.month == self.current_month
             ]
-            total = sum(e.amount for e in monthly)
+            total = sum(map(_get_amount, monthly))
             if total > budget:
                 overspent.append(info["label"])
         return overspent
 
-    def _refresh_table(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        if self.current_manager:
-            expenses = self.current_manager.filter_by_month(self.current_year, self.current_month)
-            for e in expenses:
-                self.tree.insert("", "end", values=(e.id, e.date.isoformat(), e.category, e.description, f"{e.amount:.2f}"))
+    def _refresh_table(self, expenses: Optional[List[Expense]] = None):
+        """Bring the tree in line with the current month by diffing on expense id"""
+        view = (self.current_manager, self.current_year, self.current_month)
+        if view != self._tree_view:
+            # Another month or section starts again from its first page
+            self._tree_view = view
+            self._tree_limit = _TREE_PAGE_ROWS
+        if expenses is None:
+            expenses = (self.current_manager.filter_by_month(self.current_year, self.current_month)
+                        if self.current_manager else [])
+        self._filtered = expenses
+        new_rows = {}
+        # Only the first _tree_limit rows are materialised; scrolling pages in more
+        for e in self._filtered[:self._tree_limit]:
+            new_rows[str(e.id)] = e.display_row()
+        rows = self._tree_rows
+        stale = [iid for iid in rows if iid not in new_rows]
+        if stale:
+            self.tree.delete(*stale)
+        inserts = []
+        for iid, values in new_rows.items():
+            old = rows.get(iid)
+            if old is None:
+                inserts.append((iid, values))
+            elif old != values:
+                self.tree.item(iid, values=values)
+        # Unmap the tree for big batches (first load, month or section change) so it
+        # lays out once instead of after every row
+        detach = len(inserts) > _TREE_DETACH_ROWS
+        if detach:
+            self.tree.pack_forget()
+        if inserts:
+            self._insert_tree_rows(inserts)
+        # Restore file order in one call if inserts or a section switch shuffled it
+        order = tuple(new_rows)
+        if self.tree.get_children() != order:
+            self.tree.set_children("", *order)
+        if detach:
+            self.tree.pack(side="left", fill="both", expand=True, before=self._tree_vsb)
+        self._tree_rows = new_rows
+
+    def _on_tree_scroll(self, first: str, last: str):
+        self._tree_vsb.set(first, last)
+        # Page in the next rows once the view nears the end of what is materialised
+        if float(last) >= 0.9 and self._tree_limit < len(self._filtered):
+            start = self._tree_limit
+            self._tree_limit += _TREE_PAGE_ROWS
+            page = [(str(e.id), e.display_row()) for e in self._filtered[start:self._tree_limit]]
+            self._insert_tree_rows(page)
+            self._tree_rows.update(page)
+
+    def _insert_tree_rows(self, rows: List[Tuple[str, tuple]]):
+        """Append (iid, values) rows to the table in a single Tcl call"""
+        self.tk.call(_TREE_INSERT_PROC, str(self.tree), tuple(chain.from_iterable(rows)))
 
     def _refresh_summary(self):
         if not self.current_manager:
             return
-        expenses = self.current_manager.filter_by_month(self.current_year, self.current_month)
-        breakdown = Analyzer.category_breakdown(expenses)
-        summary = Analyzer.monthly_summary(expenses)
+        # Nobody can see the text while the window is withdrawn or minimised; catch up on <Map>
+        if not self.summary_text.winfo_viewable():
+            self._summary_dirty = True
+            return
+        self._summary_dirty = False
+        total, avg_per_day, days, breakdown = self.current_manager.full_summary(
+            self.current_year, self.current_month)
         budget = float(self.budgets.get(self.current_section, 0.0))
-        
-        self.summary_text.delete("1.0", "end")
-        line_no = 1
+
+        parts: List[str] = []
+        tagged: List[Tuple[str, int, int]] = []
 
         def add_line(line: str, tag: Optional[str] = None) -> None:
-            nonlocal line_no
-            self.summary_text.insert("end", line + "\n")
             if tag and line:
-                start = f"{line_no}.0"
-                end = f"{line_no}.{len(line)}"
-                self.summary_text.tag_add(tag, start, end)
-            line_no += 1
+                tagged.append((tag, len(parts) + 1, len(line)))
+            parts.append(line + "\n")
 
-        add_line(f"{self.section_info['emoji']} {self.section_info['label']} - MONTHLY ANALYSIS")
+        add_line(f"{self.section_emoji} {self.section_label} - MONTHLY ANALYSIS")
         add_line(f"{self.current_year}-{self.current_month:02d} | " + "=" * 60)
         add_line("")
 
@@ -1753,36 +2454,40 @@ class ExpenseApp(tk.Tk):
         add_line("─" * 60)
         if budget <= 0:
             add_line("Target Budget: Not set")
-            add_line(f"Spent This Month: ₹{summary['total']:,.2f}")
+            add_line(f"Spent This Month: ₹{total:,.2f}")
             add_line("Status: Set Budget", tag="status_warn")
         else:
             add_line(f"Target Budget: ₹{budget:,.2f}")
-            add_line(f"Spent This Month: ₹{summary['total']:,.2f}")
-            add_line(f"Utilization: ₹{summary['total']:,.2f} / ₹{budget:,.2f}")
-            if summary['total'] <= budget:
-                remaining = budget - summary['total']
+            add_line(f"Spent This Month: ₹{total:,.2f}")
+            add_line(f"Utilization: ₹{total:,.2f} / ₹{budget:,.2f}")
+            if total <= budget:
+                remaining = budget - total
                 add_line(f"Status: Underused | Safe to Spend: ₹{remaining:,.2f}", tag="status_good")
             else:
-                deficit = summary['total'] - budget
+                deficit = total - budget
                 add_line("Status: Overused", tag="status_bad")
                 add_line(f"Deficit: ₹{deficit:,.2f}", tag="status_bad")
                 add_line("Restriction: Overspent. Pause non-essential spending.", tag="status_bad")
         add_line("")
 
-        add_line(f"💰 Total Spent: ₹{summary['total']:,.2f}")
-        add_line(f"📅 Days Recorded: {len(set(e.date for e in expenses))}")
-        add_line(f"📈 Average/Day: ₹{summary['avg_per_day']:,.2f}")
+        add_line(f"💰 Total Spent: ₹{total:,.2f}")
+        add_line(f"📅 Days Recorded: {days}")
+        add_line(f"📈 Average/Day: ₹{avg_per_day:,.2f}")
         add_line("")
 
         if breakdown:
             add_line("🏷️  CATEGORY BREAKDOWN (Top 10):")
             add_line("─" * 60)
-            for cat, amt in sorted(breakdown.items(), key=lambda x: x[1], reverse=True)[:10]:
-                pct = (amt / summary['total'] * 100) if summary['total'] > 0 else 0
+            for cat, amt in nlargest(10, breakdown.items(), key=itemgetter(1)):
+                pct = (amt / total * 100) if total > 0 else 0
                 add_line(f"{cat:<20} ₹{amt:>12,.2f} ({pct:>6.1f}%)")
         else:
             add_line("No expenses recorded for this month.")
 
+        self.summary_text.replace("1.0", "end", "".join(parts))
+        for tag, line_no, length in tagged:
+            self.summary_text.tag_add(tag, f"{line_no}.0", f"{line_no}.{length}")
+
 
 # -----------------------------
 # Entry Point
@@ -0,0 +1,114 @@
+"""Numeric kernels behind Analyzer.
+
+Run ``python analyzer_kernels.py`` once to compile them ahead of time with
+numba.pycc; the resulting ``_analyzer_kernels_aot`` extension is picked up
+automatically so charts pay no JIT latency. Without it the kernels are
+JIT-compiled when numba is installed, and fall back to NumPy otherwise.
+Each kernel is resolved on its first call, so importing this module does
+not import numba.
+"""
+
+import numpy as np
+
+_MONTH_AGG_SIGNATURE = "Tuple((float64, int64, float64[:]))(int32[:], int32[:], float64[:], int64[:], int64, int64, int64)"
+_CATEGORY_SUMS_SIGNATURE = "float64[:](int64[:], float64[:], int64)"
+_DAILY_SUMS_SIGNATURE = "Tuple((int32[:], float64[:]))(int32[:], float64[:])"
+
+
+def _month_agg_loop(month_keys, date_ords, amounts, cat_ids, key, first_ord, ncats):
+    """Single pass returning (total, distinct days, per-category totals) for one month"""
+    total = 0.0
+    day_bits = np.int64(0)
+    cat_totals = np.zeros(ncats)
+    for i in range(amounts.size):
+        if month_keys[i] == key:
+            total += amounts[i]
+            day_bits |= np.int64(1) << (date_ords[i] - first_ord)
+            cat_totals[cat_ids[i]] += amounts[i]
+    days = 0
+    while day_bits:
+        days += day_bits & 1
+        day_bits >>= 1
+    return total, days, cat_totals
+
+
+def _month_agg_numpy(month_keys, date_ords, amounts, cat_ids, key, first_ord, ncats):
+    mask = month_keys == key
+    month_amounts = amounts[mask]
+    days = np.unique(date_ords[mask]).size
+    cat_totals = np.bincount(cat_ids[mask], weights=month_amounts, minlength=ncats)
+    return float(month_amounts.sum()), days, cat_totals
+
+
+def _category_sums_loop(cat_ids, amounts, ncats):
+    """Per-category totals, one accumulation per row"""
+    out = np.zeros(ncats)
+    for i in range(cat_ids.size):
+        out[cat_ids[i]] += amounts[i]
+    return out
+
+
+def _category_sums_numpy(cat_ids, amounts, ncats):
+    return np.bincount(cat_ids, weights=amounts, minlength=ncats)
+
+
+def _daily_sums_loop(date_ords, amounts):
+    """Sorted distinct days and their totals: sort once, then a segmented sum"""
+    order = np.argsort(date_ords)
+    days = np.empty(date_ords.size, dtype=np.int32)
+    totals = np.zeros(date_ords.size)
+    n = -1
+    for i in order:
+        if n < 0 or date_ords[i] != days[n]:
+            n += 1
+            days[n] = date_ords[i]
+        totals[n] += amounts[i]
+    return days[:n + 1], totals[:n + 1]
+
+
+def _daily_sums_numpy(date_ords, amounts):
+    days, inverse = np.unique(date_ords, return_inverse=True)
+    return days, np.bincount(inverse, weights=amounts, minlength=days.size)
+
+
+def _select(name, loop, fallback):
+    """The AOT build of a kernel if present, else its numba JIT, else the NumPy fallback"""
+    try:
+        import _analyzer_kernels_aot
+        return getattr(_analyzer_kernels_aot, name)
+    except (ImportError, AttributeError):
+        pass
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; NumPy kernels are used instead
+        return fallback
+    return njit(cache=True)(loop)
+
+
+def _lazy(name, loop, fallback):
+    """Defer _select, and with it the numba import, until the kernel is first called"""
+    kernel = None
+
+    def call(*args):
+        nonlocal kernel
+        if kernel is None:
+            kernel = _select(name, loop, fallback)
+        return kernel(*args)
+
+    call.__name__ = call.__qualname__ = name
+    return call
+
+
+month_agg = _lazy("month_agg", _month_agg_loop, _month_agg_numpy)
+category_sums = _lazy("category_sums", _category_sums_loop, _category_sums_numpy)
+daily_sums = _lazy("daily_sums", _daily_sums_loop, _daily_sums_numpy)
+
+
+if __name__ == "__main__":
+    from numba.pycc import CC
+
+    cc = CC("_analyzer_kernels_aot")
+    cc.export("month_agg", _MONTH_AGG_SIGNATURE)(_month_agg_loop)
+    cc.export("category_sums", _CATEGORY_SUMS_SIGNATURE)(_category_sums_loop)
+    cc.export("daily_sums", _DAILY_SUMS_SIGNATURE)(_daily_sums_loop)
+    cc.compile()